@@ -14,9 +14,10 @@
 #
 
 import unittest
-from nose.tools import assert_equal
+from nose.tools import assert_equal, assert_raises
 
 from wa.framework.configuration.execution import ConfigManager
+from wa.framework.target.config import TargetConfig
 from wa.utils.misc import merge_config_values
 
 
@@ -57,3 +58,21 @@ class TestConfigParser(unittest.TestCase):
             config.jobs_config.job_spec_template['runtime_parameters'],
             {'aye': 'a', 'bee': 'b'},
         )
+
+
+class TestTargetConfig(unittest.TestCase):
+
+    def test_from_dict(self):
+        config = TargetConfig({'name': 'generic_android', 'port': 5555})
+        assert_equal(config.name, 'generic_android')
+        assert_equal(config.port, 5555)
+
+    def test_copy(self):
+        original = TargetConfig({'name': 'generic_android'})
+        config = TargetConfig(original)
+        assert_equal(config.name, 'generic_android')
+        config.set('name', 'juno')
+        assert_equal(original.name, 'generic_android')
+
+    def test_invalid(self):
+        assert_raises(ValueError, TargetConfig, ['name'])
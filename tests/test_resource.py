@@ -0,0 +1,42 @@
+#    Copyright 2024 ARM Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+# pylint: disable=R0201
+from unittest import TestCase
+
+from nose.tools import assert_true, assert_false
+
+from wa.framework.resource import loose_version_matching
+
+
+class TestLooseVersionMatching(TestCase):
+
+    def test_exact_match(self):
+        assert_true(loose_version_matching('1.2.3', '1.2.3'))
+
+    def test_prefix_match(self):
+        assert_true(loose_version_matching('1', '1.2.3'))
+        assert_true(loose_version_matching('1.2', '1.2.3'))
+        assert_true(loose_version_matching('1.2', '1-2-3'))
+
+    def test_mismatch(self):
+        assert_false(loose_version_matching('1.3', '1.2.3'))
+        assert_false(loose_version_matching('2', '1.2.3'))
+        # Components are compared whole, not as string prefixes.
+        assert_false(loose_version_matching('1.2', '1.20.3'))
+
+    def test_more_specific_than_available(self):
+        assert_false(loose_version_matching('1.2.3', '1.2'))
@@ -0,0 +1,80 @@
+#    Copyright 2024 ARM Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+# pylint: disable=R0201
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from nose.tools import assert_equal
+
+from wa.utils.revent import (ReventRecording, GENERAL_MODE, header_one_struct,
+                             header_two_struct, u32_struct, u64_struct,
+                             event_struct, old_event_struct)
+
+
+# (seconds, microseconds) timestamps of the recorded events
+TIMESTAMPS = [(100, 0), (100, 250000), (101, 500000), (103, 750000)]
+
+
+def write_recording(path, version, timestamps):
+    with open(path, 'wb') as wfh:
+        wfh.write(header_one_struct.pack(b'REVENT', version))
+        if version >= 2:
+            wfh.write(header_two_struct.pack(GENERAL_MODE))
+        device = b'/dev/input/event0'
+        wfh.write(u32_struct.pack(1))
+        wfh.write(u32_struct.pack(len(device)))
+        wfh.write(device)
+        if version >= 2:
+            wfh.write(u64_struct.pack(len(timestamps)))
+        for sec, usec in timestamps:
+            if version >= 2:
+                wfh.write(event_struct.pack(0, sec, usec, 1, 2, 3))
+            else:
+                wfh.write(old_event_struct.pack(0, sec, usec, 1, 2, 3))
+
+
+class TestReventRecordingDuration(TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _check_duration(self, version, timestamps, expected):
+        path = os.path.join(self.tempdir, 'v{}-{}.revent'.format(version, len(timestamps)))
+        write_recording(path, version, timestamps)
+        with ReventRecording(path) as recording:
+            assert_equal(recording.duration, expected)
+            # Must agree with the duration of a fully parsed recording.
+            assert_equal(len(list(recording.events)), len(timestamps))
+        parsed = ReventRecording(path, stream=False)
+        assert_equal(parsed.duration, expected)
+
+    def test_empty(self):
+        for version in (1, 2):
+            self._check_duration(version, [], 0)
+
+    def test_single_event(self):
+        for version in (1, 2):
+            self._check_duration(version, TIMESTAMPS[:1], 0)
+
+    def test_multiple_events(self):
+        for version in (1, 2):
+            self._check_duration(version, TIMESTAMPS, 3.75)
@@ -17,9 +17,11 @@
 # pylint: disable=R0201
 from unittest import TestCase
 
+from mock.mock import patch
 from nose.tools import raises, assert_equal, assert_not_equal, assert_in, assert_not_in
 from nose.tools import assert_true, assert_false, assert_raises, assert_is, assert_list_equal
 
+from wa.utils.misc import which
 from wa.utils.types import (list_or_integer, list_or_bool, caseless_string,
                             arguments, prioritylist, enum, level, toggle_set)
 
@@ -197,3 +199,25 @@ class  TestToggleSet(TestCase):
 
         ts1 = toggle_set(['~one', 'two', 'three', 'one'])
         assert_equal(ts1, toggle_set(['one', 'two', 'three']))
+
+
+class TestWhich(TestCase):
+
+    def setUp(self):
+        which.cache_clear()
+
+    def tearDown(self):
+        which.cache_clear()
+
+    def test_lookups_are_cached(self):
+        with patch('wa.utils.misc._which', side_effect=lambda name: '/usr/bin/' + name) as lookup:
+            assert_equal(which('adb'), '/usr/bin/adb')
+            assert_equal(which('adb'), '/usr/bin/adb')
+            assert_equal(which('fastboot'), '/usr/bin/fastboot')
+        assert_equal(lookup.call_count, 2)
+
+    def test_missing_binaries_are_cached(self):
+        with patch('wa.utils.misc._which', return_value=None) as lookup:
+            assert_is(which('not-a-binary'), None)
+            assert_is(which('not-a-binary'), None)
+        assert_equal(lookup.call_count, 1)
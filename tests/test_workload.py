@@ -0,0 +1,128 @@
+#    Copyright 2024 ARM Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+# pylint: disable=R0201
+import os
+import posixpath
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mock.mock import Mock, call
+from devlib.exception import TargetStableError
+from nose.tools import assert_equal, assert_raises
+
+from wa.framework.workload import (Workload, PackageHandler, PERMISSION_GRANT_MARKER,
+                                   PERMISSION_GRANTS_PER_COMMAND)
+from wa.utils.misc import sha256
+
+
+class MockWorkload(Workload):
+
+    name = 'mock'
+
+
+def mock_target(sha256sum_output=''):
+    target = Mock(os='linux', busybox='busybox', path=posixpath,
+                  working_directory='/data/local/tmp')
+    target.execute.return_value = sha256sum_output
+    return target
+
+
+class TestDeployAssets(TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.assets = []
+        for name in ('first.tar', 'second.tar'):
+            path = os.path.join(self.tempdir, name)
+            with open(path, 'w') as wfh:
+                wfh.write(name)
+            self.assets.append(path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _deploy(self, sha256sum_output):
+        target = mock_target(sha256sum_output)
+        workload = MockWorkload(target)
+        workload.asset_files = self.assets
+        workload.deploy_assets(None)
+        assert_equal(workload.deployed_assets, ['/data/local/tmp/first.tar',
+                                                '/data/local/tmp/second.tar'])
+        return target
+
+    def test_up_to_date(self):
+        output = ''.join('{}  /data/local/tmp/{}\n'.format(sha256(a), os.path.basename(a))
+                         for a in self.assets)
+        target = self._deploy(output)
+        assert_equal(target.push.call_count, 0)
+        # All assets are hashed in a single round-trip.
+        assert_equal(target.execute.call_count, 1)
+
+    def test_missing_asset(self):
+        # e.g. moved elsewhere by the workload after a previous deployment
+        output = '{}  /data/local/tmp/first.tar\n'.format(sha256(self.assets[0]))
+        target = self._deploy(output)
+        assert_equal(target.push.call_args_list,
+                     [call(self.assets[1], '/data/local/tmp')])
+
+    def test_stale_digest(self):
+        output = '{}  /data/local/tmp/first.tar\n{}  /data/local/tmp/second.tar\n'
+        target = self._deploy(output.format('0' * 64, sha256(self.assets[1])))
+        assert_equal(target.push.call_args_list,
+                     [call(self.assets[0], '/data/local/tmp')])
+
+
+def grant_output(*results):
+    return ''.join('{}\n{}'.format(PERMISSION_GRANT_MARKER, r) for r in results)
+
+
+class TestGrantPermissions(TestCase):
+
+    permissions = ['android.permission.CAMERA',
+                   'android.permission.INTERNET',
+                   'android.permission.READ_CONTACTS']
+
+    def _grant(self, output, permissions=None):
+        target = mock_target(output)
+        handler = PackageHandler(Mock(target=target))
+        handler.apk_info = Mock(package='com.example')
+        handler.grant_permissions(permissions or self.permissions)
+        return target
+
+    def test_success(self):
+        self._grant(grant_output('', '', ''))
+
+    def test_ignored_error(self):
+        error = ('Exception occurred while executing: java.lang.SecurityException: '
+                 'Permission android.permission.INTERNET is not a changeable '
+                 'permission type\nexit code 255\n')
+        self._grant(grant_output('', error, ''))
+
+    def test_error(self):
+        error = 'Error: unable to grant permission\nexit code 1\n'
+        assert_raises(TargetStableError, self._grant, grant_output('', '', error))
+
+    def test_success_with_warnings(self):
+        warning = 'WARNING: linker: unused DT entry: type 0x6ffffffe\n'
+        self._grant(grant_output(warning, warning, warning))
+
+    def test_batched(self):
+        permissions = ['android.permission.P{}'.format(i)
+                       for i in range(PERMISSION_GRANTS_PER_COMMAND + 1)]
+        target = self._grant(grant_output(''), permissions)
+        assert_equal(target.execute.call_count, 2)
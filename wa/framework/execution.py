@@ -106,6 +106,7 @@ class ExecutionContext(object):
         self.successful_jobs = 0
         self.failed_jobs = 0
         self.run_interrupted = False
+        self._resource_hashes = {}
         self._load_resource_getters()
 
     def start_run(self):
@@ -198,10 +199,8 @@ class ExecutionContext(object):
         if result is None:
             return result
         if os.path.isfile(result):
-            with open(result, 'rb') as fh:
-                md5hash = hashlib.md5(fh.read())
-                key = '{}/{}'.format(resource.owner, os.path.basename(result))
-                self.update_metadata('hashes', key, md5hash.hexdigest())
+            key = '{}/{}'.format(resource.owner, os.path.basename(result))
+            self.update_metadata('hashes', key, self._get_resource_hash(result))
         return result
 
     get = get_resource  # alias to allow a context to act as a resolver
@@ -303,6 +302,19 @@ class ExecutionContext(object):
         self.job_queue = new_queue
         self.write_state()
 
+    def _get_resource_hash(self, path):
+        # The same resource is typically resolved once for every spec that
+        # uses it, so only re-hash the file if it has changed on the host.
+        stat = os.stat(path)
+        key = (os.path.realpath(path), stat.st_mtime, stat.st_size)
+        if key not in self._resource_hashes:
+            md5hash = hashlib.md5()
+            with open(path, 'rb') as fh:
+                for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                    md5hash.update(chunk)
+            self._resource_hashes[key] = md5hash.hexdigest()
+        return self._resource_hashes[key]
+
     def _load_resource_getters(self):
         self.logger.debug('Loading resource discoverers')
         self.resolver = ResourceResolver(self.cm.plugin_cache)
@@ -221,7 +221,7 @@ class Http(ResourceGetter):
                 self.index = self.fetch_index()
             except requests.exceptions.RequestException as e:
                 msg = 'Skipping HTTP getter due to connection error: {}'
-                self.logger.debug(msg.format(e.message))
+                self.logger.debug(msg.format(e))
                 return
         if resource.kind == 'apk':
             # APKs must always be downloaded to run ApkInfo for version
@@ -157,27 +157,23 @@ class ApkFile(Resource):
         return ext == '.apk'
 
     def match(self, path):
-        name_matches = True
-        version_matches = True
-        version_range_matches = True
-        package_matches = True
-        abi_matches = True
-        uiauto_matches = uiauto_test_matches(path, self.uiauto)
-        if self.version:
-            version_matches = apk_version_matches(path, self.version)
-        if self.max_version or self.min_version:
-            version_range_matches = apk_version_matches_range(path, self.min_version,
-                                                              self.max_version)
-        if self.variant:
-            name_matches = file_name_matches(path, self.variant)
-        if self.package:
-            package_matches = package_name_matches(path, self.package)
-        if self.supported_abi:
-            abi_matches = apk_abi_matches(path, self.supported_abi,
-                                          self.exact_abi)
-        return name_matches and version_matches and \
-            version_range_matches and uiauto_matches \
-            and package_matches and abi_matches
+        # Check the file name first as it does not require the APK to be
+        # parsed, and stop at the first criterion that does not match.
+        if self.variant and not file_name_matches(path, self.variant):
+            return False
+        if not uiauto_test_matches(path, self.uiauto):
+            return False
+        if self.package and not package_name_matches(path, self.package):
+            return False
+        if self.version and not apk_version_matches(path, self.version):
+            return False
+        if (self.max_version or self.min_version) and \
+                not apk_version_matches_range(path, self.min_version, self.max_version):
+            return False
+        if self.supported_abi and \
+                not apk_abi_matches(path, self.supported_abi, self.exact_abi):
+            return False
+        return True
 
     def __str__(self):
         text = '<{}\'s apk'.format(self.owner)
@@ -316,10 +312,7 @@ def loose_version_matching(config_version, apk_version):
     if len(apk_version) < len(config_version):
         return False  # More specific version requested than available
 
-    for i in range(len(config_version)):
-        if config_version[i] != apk_version[i]:
-            return False
-    return True
+    return apk_version[:len(config_version)] == config_version
 
 
 def file_name_matches(path, pattern):
@@ -213,15 +213,13 @@ class LogcatPoller(threading.Thread):
         self.logger.debug('Starting polling')
         try:
             self.insert_logcat_marker()
-            while True:
-                if self.stop_signal.is_set():
-                    break
+            while not self.stop_signal.is_set():
                 with self.lock:
                     current_time = time.time()
                     if (current_time - self.last_poll) >= self.period:
                         self.poll()
                         self.insert_logcat_marker()
-                time.sleep(0.5)
+                self.stop_signal.wait(0.5)
         except Exception:  # pylint: disable=W0703
             self.exc = WorkerThreadError(self.name, sys.exc_info())
         self.logger.debug('Polling stopped')
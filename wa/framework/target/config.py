@@ -25,8 +25,8 @@ class TargetConfig(dict):
         dict.__init__(self)
         if isinstance(config, TargetConfig):
             self.__dict__ = copy(config.__dict__)
-        elif hasattr(config, 'iteritems'):
-            for k, v in config.iteritems:
+        elif hasattr(config, 'items'):
+            for k, v in config.items():
                 self.set(k, v)
         elif config:
             raise ValueError(config)
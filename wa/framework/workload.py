@@ -14,6 +14,7 @@
 #
 import logging
 import os
+import re
 import threading
 import time
 
@@ -23,6 +24,8 @@ except ImportError:
     from pipes import quote
 
 
+from devlib.exception import TargetStableError
+
 from wa.utils.android import get_cacheable_apk_info, build_apk_launch_command
 from wa.framework.plugin import TargetedPlugin, Parameter
 from wa.framework.resource import (ApkFile, ReventFile,
@@ -32,7 +35,20 @@ from wa.framework.exception import WorkloadError, ConfigError
 from wa.utils.types import ParameterDict, list_or_string, version_tuple
 from wa.utils.revent import ReventRecorder
 from wa.utils.exec_control import once_per_instance
-from wa.utils.misc import atomic_write_path
+from wa.utils.misc import atomic_write_path, sha256
+
+
+# Errors from "pm grant" that are ignored, as they are by devlib's
+# AndroidTarget.grant_package_permission.
+IGNORED_PERMISSION_ERRORS = ('is not a changeable permission type',
+                             'Unknown permission',
+                             'has not requested permission',
+                             'Operation not allowed')
+PERMISSION_GRANT_MARKER = '__WA_PM_GRANT__'
+PERMISSION_GRANT_FAILURE_REGEX = re.compile(r'^exit code \d+$')
+# Number of grants issued per shell invocation, keeping the command well
+# within the length accepted by older adb shell services.
+PERMISSION_GRANTS_PER_COMMAND = 20
 
 
 class Workload(TargetedPlugin):
@@ -76,6 +92,7 @@ class Workload(TargetedPlugin):
         super(Workload, self).__init__(target, **kwargs)
         self.asset_files = []
         self.deployed_assets = []
+        self._tar_command = None
 
         supported_platforms = getattr(self, 'supported_platforms', [])
         if supported_platforms and self.target.os not in supported_platforms:
@@ -153,16 +170,64 @@ class Workload(TargetedPlugin):
         else:
             self.target.execute('mkdir -p {}'.format(self.asset_directory))
 
-        for asset in self.asset_files:
-            self.target.push(asset, self.asset_directory)
-            self.deployed_assets.append(self.target.path.join(self.asset_directory,
-                                                              os.path.basename(asset)))
+        on_target = [self.target.path.join(self.asset_directory, os.path.basename(asset))
+                     for asset in self.asset_files]
+        # Assets left over from a previous run are not pushed again if their
+        # content on the target is unchanged.
+        target_digests = _get_target_digests(self.target, on_target)
+        for asset, target_path in zip(self.asset_files, on_target):
+            if target_digests.get(target_path) == sha256(asset):
+                self.logger.debug('"{}" is up to date on target'.format(os.path.basename(asset)))
+            else:
+                self.target.push(asset, self.asset_directory)
+            self.deployed_assets.append(target_path)
 
     def remove_assets(self, context):
         """ Cleanup assets deployed to the target """
         # pylint: disable=unused-argument
-        for asset in self.deployed_assets:
-            self.target.remove(asset)
+        if not self.deployed_assets:
+            return
+        paths = ' '.join(quote(asset) for asset in self.deployed_assets)
+        self.target.execute('rm -rf -- {}'.format(paths))
+
+    def extract_assets(self, assets, timeout=None):
+        """
+        Extract deployed tarball assets on the target. ``assets`` is a list of
+        ``(asset, destination)`` tuples where ``asset`` is the name of a
+        deployed asset and ``destination`` the directory on the target it
+        should be extracted into. ``destination`` should be a raw path (i.e.
+        not escaped for the shell), as it will be quoted by this method.
+
+        Uncompressed (``.tar``) and gzip compressed (``.tar.gz`` / ``.tgz``)
+        tarballs are supported. Uncompressed tarballs should be preferred as
+        they avoid the decompression cost on the target.
+
+        """
+        for asset, destination in assets:
+            source = self.target.path.join(self.asset_directory, asset)
+            cmd = self._get_extract_command(asset, source, destination)
+            self.target.execute(cmd, as_root=True, timeout=timeout)
+
+    def _get_tar_command(self):
+        # Prefer the native toybox tar available on newer Android releases
+        # over busybox; the result is cached as it requires a target round-trip.
+        if self._tar_command is None:
+            self._tar_command = '{} tar'.format(self.target.busybox)
+            if self.target.os == 'android':
+                output = self.target.execute('toybox tar --help > /dev/null 2>&1 && echo 1',
+                                             check_exit_code=False)
+                if output.strip() == '1':
+                    self._tar_command = 'toybox tar'
+        return self._tar_command
+
+    def _get_extract_command(self, asset, source, destination):
+        tar = self._get_tar_command()
+        source, destination = quote(source), quote(destination)
+        if asset.endswith('.tar'):
+            return '{} -xf {} -C {}'.format(tar, source, destination)
+        if asset.endswith(('.tar.gz', '.tgz')):
+            return '{} -xzf {} -C {}'.format(tar, source, destination)
+        raise WorkloadError('Unsupported tarball format for asset "{}"'.format(asset))
 
     def __str__(self):
         return '<Workload {}>'.format(self.name)
@@ -526,16 +591,16 @@ class UiAutomatorGUI(object):
     def init_commands(self):
         params_dict = self.uiauto_params
         params_dict['workdir'] = self.target.working_directory
-        params = ''
-        for k, v in params_dict.iter_encoded_items():
-            params += ' -e {} {}'.format(k, v)
+        # Values are already url-encoded, so do not need further quoting.
+        params = ''.join(' -e {} {}'.format(k, v)
+                         for k, v in params_dict.iter_encoded_items())
 
+        instrumentation_string = '{}/{}'.format(self.uiauto_package,
+                                                self.uiauto_runner)
+        cmd_template = 'am instrument -w -r{} -e class {} {}'
         for stage in self.stages:
             class_string = '{}.{}#{}'.format(self.uiauto_package, self.uiauto_class,
                                              stage)
-            instrumentation_string = '{}/{}'.format(self.uiauto_package,
-                                                    self.uiauto_runner)
-            cmd_template = 'am instrument -w -r{} -e class {} {}'
             self.commands[stage] = cmd_template.format(params, class_string,
                                                        instrumentation_string)
 
@@ -646,10 +711,11 @@ class ReventGUI(object):
                                         timeout=self.teardown_timeout)
 
     def remove(self):
-        self.target.remove(self.on_target_setup_revent)
-        self.target.remove(self.on_target_run_revent)
-        self.target.remove(self.on_target_extract_results_revent)
-        self.target.remove(self.on_target_teardown_revent)
+        paths = [self.on_target_setup_revent,
+                 self.on_target_run_revent,
+                 self.on_target_extract_results_revent,
+                 self.on_target_teardown_revent]
+        self.target.execute('rm -rf -- {}'.format(' '.join(quote(p) for p in paths)))
         self.revent_recorder.remove()
 
     def _check_revent_files(self):
@@ -659,13 +725,18 @@ class ReventGUI(object):
                       'Please provide one for your target, {0}'
             raise WorkloadError(message.format(self.target.model))
 
-        self.target.push(self.revent_run_file, self.on_target_run_revent)
-        if self.revent_setup_file:
-            self.target.push(self.revent_setup_file, self.on_target_setup_revent)
-        if self.revent_extract_results_file:
-            self.target.push(self.revent_extract_results_file, self.on_target_extract_results_revent)
-        if self.revent_teardown_file:
-            self.target.push(self.revent_teardown_file, self.on_target_teardown_revent)
+        revent_files = [(self.revent_run_file, self.on_target_run_revent),
+                        (self.revent_setup_file, self.on_target_setup_revent),
+                        (self.revent_extract_results_file, self.on_target_extract_results_revent),
+                        (self.revent_teardown_file, self.on_target_teardown_revent)]
+        revent_files = [(h, t) for h, t in revent_files if h]
+
+        # Recordings are checked before every iteration, but rarely change
+        # between them; only push those that differ from what is on target.
+        target_digests = _get_target_digests(self.target, [t for _, t in revent_files])
+        for host_file, target_file in revent_files:
+            if target_digests.get(target_file) != sha256(host_file):
+                self.target.push(host_file, target_file)
 
 
 class PackageHandler(object):
@@ -790,16 +861,17 @@ class PackageHandler(object):
     def resolve_package_from_target(self):  # pylint: disable=too-many-branches
         self.logger.debug('Resolving package on target')
         found_package = None
+        # package_is_installed() lists all packages on every call, so list
+        # them once and check candidates against that.
+        installed_packages = set(self.target.list_packages())
         if self.package_name:
-            if not self.target.package_is_installed(self.package_name):
+            if self.package_name not in installed_packages:
                 return
             else:
                 installed_versions = [self.package_name]
         else:
-            installed_versions = []
-            for package in self.owner.package_names:
-                if self.target.package_is_installed(package):
-                    installed_versions.append(package)
+            installed_versions = [package for package in self.owner.package_names
+                                  if package in installed_packages]
 
         if self.version or self.min_version or self.max_version:
             matching_packages = []
@@ -851,10 +923,32 @@ class PackageHandler(object):
             self.reset(context)
             if self.apk_info.permissions:
                 self.logger.debug('Granting runtime permissions')
-                for permission in self.apk_info.permissions:
-                    self.target.grant_package_permission(self.apk_info.package, permission)
+                self.grant_permissions(self.apk_info.permissions)
         self.apk_version = host_version
 
+    def grant_permissions(self, permissions):
+        # Grant permissions in batches, each from a single shell invocation.
+        # The grants are independent of each other, as manifests usually list
+        # permissions (e.g. normal ones such as INTERNET) that cannot be granted
+        # at runtime. A grant that exits with a non-zero status has its exit
+        # code appended to its output, which is then checked for the errors
+        # that devlib's grant_package_permission would ignore as well.
+        package = self.apk_info.package
+        grant_cmd = 'echo {}; pm grant {} {} 2>&1 || echo "exit code $?"'
+        for i in range(0, len(permissions), PERMISSION_GRANTS_PER_COMMAND):
+            batch = permissions[i:i + PERMISSION_GRANTS_PER_COMMAND]
+            cmd = '; '.join(grant_cmd.format(PERMISSION_GRANT_MARKER, quote(package), quote(p))
+                            for p in batch)
+            output = self.target.execute(cmd, check_exit_code=False)
+            results = output.split(PERMISSION_GRANT_MARKER)[1:]
+            for permission, result in zip(batch, results):
+                lines = result.strip().splitlines()
+                if not lines or not PERMISSION_GRANT_FAILURE_REGEX.match(lines[-1].strip()):
+                    continue  # Succeeded, possibly with warnings
+                if not any(e in result for e in IGNORED_PERMISSION_ERRORS):
+                    message = 'Could not grant "{}" to {}:\n{}'
+                    raise TargetStableError(message.format(permission, package, result.strip()))
+
     def start_activity(self):
 
         cmd = build_apk_launch_command(self.apk_info.package, self.activity,
@@ -872,9 +966,11 @@ class PackageHandler(object):
         self.start_activity()
 
     def reset(self, context):  # pylint: disable=W0613
-        self.target.execute('am force-stop {}'.format(self.apk_info.package))
+        # Issued as a single shell invocation to save a target round-trip.
+        cmd = 'am force-stop {}'.format(self.apk_info.package)
         if self.clear_data_on_reset:
-            self.target.execute('pm clear {}'.format(self.apk_info.package))
+            cmd += ' && pm clear {}'.format(self.apk_info.package)
+        self.target.execute(cmd)
 
     def install_apk(self, context):
         # pylint: disable=unused-argument
@@ -896,6 +992,15 @@ class PackageHandler(object):
         package_info = self.target.get_package_info(package)
         apk_name = self._get_package_name(package_info.apk_path)
         host_path = os.path.join(self.owner.dependencies_directory, apk_name)
+        if os.path.isfile(host_path):
+            # Avoid pulling the APK again if it is unchanged since it was last
+            # pulled, e.g. by a previous run.
+            output = self.target.execute('{} sha256sum {}'.format(self.target.busybox,
+                                                                  quote(package_info.apk_path)),
+                                         check_exit_code=False)
+            if output.split()[:1] == [sha256(host_path)]:
+                self.logger.debug('Using previously pulled APK {}'.format(host_path))
+                return host_path
         with atomic_write_path(host_path) as at_path:
             self.target.pull(package_info.apk_path, at_path,
                              timeout=self.install_timeout)
@@ -984,3 +1089,19 @@ class TestPackageHandler(PackageHandler):
         if self.instrument_thread.is_alive():
             self.instrument_thread.join()  # writes self._instrument_output
         return self._instrument_output
+
+
+def _get_target_digests(target, paths):
+    # Hash all of the paths on the target in a single round-trip. Paths that
+    # do not exist produce no output, so they are missing from the result.
+    if not paths:
+        return {}
+    cmd = '{} sha256sum {} 2>/dev/null'.format(target.busybox,
+                                               ' '.join(quote(p) for p in paths))
+    output = target.execute(cmd, check_exit_code=False)
+    digests = {}
+    for line in output.splitlines():
+        parts = line.split(None, 1)
+        if len(parts) == 2:
+            digests[parts[1].strip()] = parts[0]
+    return digests
@@ -17,6 +17,7 @@
 # pylint: disable=W0613,E1101
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import os
 import shutil
 
@@ -29,12 +30,12 @@ from devlib.instrument.daq import DaqInstrument
 from devlib.instrument.acmecape import AcmeCapeInstrument
 from devlib.instrument.monsoon import MonsoonInstrument
 from devlib.platform.arm import JunoEnergyInstrument
-from devlib.utils.misc import which
 
 from wa import Instrument, Parameter
 from wa.framework import pluginloader
 from wa.framework.plugin import Plugin
 from wa.framework.exception import ConfigError, InstrumentError
+from wa.utils.misc import which
 from wa.utils.types import (list_of_strings, list_of_ints, list_or_string,
                             obj_dict, identifier, list_of_numbers)
 
@@ -283,7 +284,7 @@ class AcmeCapeBackend(EnergyInstrumentBackend):
     """
 
     parameters = [
-        Parameter('iio-capture', default=which('iio-capture'),
+        Parameter('iio-capture', default=None,
                   description="""
                   Path to the iio-capture binary will be taken from the
                   environment, if not specfied.
@@ -327,6 +328,7 @@ class AcmeCapeBackend(EnergyInstrumentBackend):
         # each of the channels reported by the instruments.
         #
 
+        iio_capture = iio_capture or which('iio-capture')
         ret = {}
         for iio_device in iio_devices:
             ret[iio_device] = AcmeCapeInstrument(
@@ -353,7 +355,7 @@ class MonsoonBackend(EnergyInstrumentBackend):
     """
 
     parameters = [
-        Parameter('monsoon_bin', default=which('monsoon.py'),
+        Parameter('monsoon_bin', default=None,
                   description="""
                   Path to monsoon.py executable. If not provided,
                   ``PATH`` is searched.
@@ -476,25 +478,29 @@ class EnergyMeasurement(Instrument):
                              channels=self.channels)
 
     def start(self, context):
-        for instrument in self.instruments.values():
-            instrument.start()
+        self._for_each_device(lambda device: self.instruments[device].start())
 
     def stop(self, context):
-        for instrument in self.instruments.values():
-            instrument.stop()
+        self._for_each_device(lambda device: self.instruments[device].stop())
 
     def update_output(self, context):
-        for device, instrument in self.instruments.items():
+        names = {}
+        for device in self.instruments:
             # Append the device key to the filename and artifact name, unless
             # it's None (as it will be for backends with only 1
             # devce/instrument)
             if len(self.instruments) > 1:
-                name = 'energy_instrument_output_{}'.format(device)
+                names[device] = 'energy_instrument_output_{}'.format(device)
             else:
-                name = 'energy_instrument_output'
+                names[device] = 'energy_instrument_output'
 
-            outfile = os.path.join(context.output_directory, '{}.csv'.format(name))
-            measurements = instrument.get_data(outfile)
+        def get_data(device):
+            outfile = os.path.join(context.output_directory, '{}.csv'.format(names[device]))
+            return self.instruments[device].get_data(outfile)
+
+        collected = self._for_each_device(get_data)
+        for device, measurements in collected.items():
+            name = names[device]
             if not measurements:
                 raise InstrumentError("Failed to collect energy data from {}"
                                       .format(self.backend.name))
@@ -538,3 +544,16 @@ class EnergyMeasurement(Instrument):
     def teardown(self, context):
         for instrument in self.instruments.values():
             instrument.teardown()
+
+    def _for_each_device(self, func):
+        # Backends such as ACME may expose an instrument per device, each
+        # capturing independently; operate on them concurrently so that they
+        # start and stop as close together as possible and their data is
+        # collected in parallel.
+        devices = list(self.instruments)
+        if len(devices) < 2:
+            results = [func(device) for device in devices]
+        else:
+            with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+                results = list(executor.map(func, devices))
+        return dict(zip(devices, results))
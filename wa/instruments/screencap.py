@@ -45,7 +45,7 @@ class ScreenCaptureInstrument(Instrument):
     def setup(self, context):
         # We need to create a directory for the captured screenshots
         output_path = os.path.join(context.output_directory, "screen-capture")
-        os.mkdir(output_path)
+        os.makedirs(output_path, exist_ok=True)
         self.collector = ScreenCaptureCollector(self.target,
                                                 self.period)
         self.collector.set_output(output_path)
@@ -34,6 +34,7 @@ logcat_logger = logging.getLogger('logcat')
 apk_info_cache_logger = logging.getLogger('apk_info_cache')
 
 apk_info_cache = None
+_apk_info_memo = {}
 
 
 class LogcatEvent(object):
@@ -184,6 +185,10 @@ def get_cacheable_apk_info(path):
     stat = os.stat(path)
     modified = stat.st_mtime
     apk_id = '{}-{}'.format(path, modified)
+    # The same APK is typically looked up several times in a run; avoid
+    # re-reading and de-serializing the on-disk cache each time.
+    if apk_id in _apk_info_memo:
+        return _apk_info_memo[apk_id]
     info = apk_info_cache.get_info(apk_id)
 
     if info:
@@ -193,6 +198,7 @@ def get_cacheable_apk_info(path):
         apk_info_cache.store(info, apk_id, overwrite=True)
         msg = 'Storing ApkInfo ({}) in cache'.format(info.package)
     apk_info_cache_logger.debug(msg)
+    _apk_info_memo[apk_id] = info
     return info
 
 
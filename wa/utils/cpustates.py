@@ -657,8 +657,7 @@ def report_power_stats(trace_file, cpus, output_basedir, use_ratios=False, no_id
 
     """
     output_directory = os.path.join(output_basedir, 'power-states')
-    if not os.path.isdir(output_directory):
-        os.mkdir(output_directory)
+    os.makedirs(output_directory, exist_ok=True)
 
     freq_dependent_idle_states = []
     if split_wfi_states:
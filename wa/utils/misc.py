@@ -37,7 +37,7 @@ import traceback
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta
-from functools import reduce  # pylint: disable=redefined-builtin
+from functools import lru_cache, reduce  # pylint: disable=redefined-builtin
 from operator import mul
 from tempfile import gettempdir, NamedTemporaryFile
 from time import sleep
@@ -50,11 +50,12 @@ from dateutil import tz
 
 # pylint: disable=wrong-import-order
 from devlib.exception import TargetError
+from devlib.utils.misc import which as _which
 from devlib.utils.misc import (ABI_MAP, check_output, walk_modules,
                                ensure_directory_exists, ensure_file_directory_exists,
                                normalize, convert_new_lines, get_cpu_mask, unique,
                                isiterable, getch, as_relative, ranges_to_list, memoized,
-                               list_to_ranges, list_to_mask, mask_to_list, which,
+                               list_to_ranges, list_to_mask, mask_to_list,
                                to_identifier, safe_extract, LoadSyntaxError)
 
 check_output_logger = logging.getLogger('check_output')
@@ -723,3 +724,12 @@ def lock_file(path, timeout=30):
         if locked and os.path.exists(l_file):
             os.remove(l_file)
             file_lock_logger.debug('Lock released "{}"'.format(path))
+
+
+@lru_cache(maxsize=None)
+def which(name):
+    """
+    Same as devlib's ``which``, but the result (including ``None`` for a
+    missing binary) is cached, so ``PATH`` is only searched once per name.
+    """
+    return _which(name)
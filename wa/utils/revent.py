@@ -144,19 +144,13 @@ class ReventRecording(object):
     def duration(self):
         if self._duration is None:
             if self.stream:
-                events = self._iter_events()
-                try:
-                    first = last = next(events)
-                except StopIteration:
-                    self._duration = 0
-                for last in events:
-                    pass
-                self._duration = (last.time - first.time).total_seconds()
+                self._duration = self._read_duration()
             else:  # not streaming
                 if not self._events:
                     self._duration = 0
-                self._duration = (self._events[-1].time
-                                  - self._events[0].time).total_seconds()
+                else:
+                    self._duration = (self._events[-1].time
+                                      - self._events[0].time).total_seconds()
         return self._duration
 
     @property
@@ -251,6 +245,26 @@ class ReventRecording(object):
             while self.fh.tell() < file_size:
                 yield ReventEvent(self.fh, legacy=True)
 
+    def _read_duration(self):
+        # Events are fixed size, so only the first and the last event need to
+        # be read rather than the entire recording.
+        if self.fh is None:
+            msg = 'Attempting to read events of a closed recording'
+            raise RuntimeError(msg)
+        legacy = self.version < 2
+        event_size = old_event_struct.size if legacy else event_struct.size
+        if legacy:
+            num_events = (os.path.getsize(self.filepath) - self._events_start) // event_size
+        else:
+            num_events = self.num_events
+        if not num_events:
+            return 0
+        self.fh.seek(self._events_start)
+        first = ReventEvent(self.fh, legacy=legacy)
+        self.fh.seek(self._events_start + (num_events - 1) * event_size)
+        last = ReventEvent(self.fh, legacy=legacy)
+        return (last.time - first.time).total_seconds()
+
     def __iter__(self):
         for event in self.events:
             yield event
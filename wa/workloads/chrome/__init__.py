@@ -13,6 +13,8 @@
 # limitations under the License.
 #
 
+from shlex import quote
+
 from wa import Parameter, ApkUiautoWorkload
 from wa.framework.exception import WorkloadError
 
@@ -83,12 +85,11 @@ class Chrome(ApkUiautoWorkload):
 
     def setup_rerun(self):
         super(Chrome, self).setup_rerun()
-        offline_pages = self.target.path.join(self.target.package_data_directory, self.package, 'app_chrome', 'Default', 'Offline\ Pages')
+        offline_pages = self.target.path.join(self.target.package_data_directory, self.package, 'app_chrome', 'Default', 'Offline Pages')
         metadata_src = self.target.path.join(self.target.working_directory, 'OfflinePages.db')
         metadata_dst = self.target.path.join(offline_pages, 'metadata')
-        archives_src = self.target.path.join(self.target.working_directory, 'pages.tar')
         archives_dst = self.target.path.join(offline_pages, 'archives')
-        owner = self.target.execute("{} stat -c '%u' {}".format(self.target.busybox, offline_pages), as_root=True).strip()
-        self.target.execute('{} tar -xvf {} -C {}'.format(self.target.busybox, archives_src, archives_dst), as_root=True)
-        self.target.execute('{} cp {} {}'.format(self.target.busybox, metadata_src, metadata_dst), as_root=True)
-        self.target.execute('{0} chown -R {1}:{1} {2}'.format(self.target.busybox, owner, offline_pages), as_root=True)
+        owner = self.target.execute("{} stat -c '%u' {}".format(self.target.busybox, quote(offline_pages)), as_root=True).strip()
+        self.extract_assets([('pages.tar', archives_dst)])
+        self.target.execute('{} cp {} {}'.format(self.target.busybox, metadata_src, quote(metadata_dst)), as_root=True)
+        self.target.execute('{0} chown -R {1}:{1} {2}'.format(self.target.busybox, owner, quote(offline_pages)), as_root=True)
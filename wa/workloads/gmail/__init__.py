@@ -103,10 +103,9 @@ class Gmail(ApkUiautoWorkload):
 
     def setup_rerun(self):
         super(Gmail, self).setup_rerun()
-        database_src = self.target.path.join(self.target.working_directory, 'mailstore.tar')
         database_dst = self.target.path.join(self.target.package_data_directory, self.package, 'databases')
         existing_mailstores = self.target.path.join(database_dst, 'mailstore.*')
         owner = self.target.execute("{} stat -c '%u' {}".format(self.target.busybox, database_dst), as_root=True).strip()
         self.target.execute('{} rm {}'.format(self.target.busybox, existing_mailstores), as_root=True)
-        self.target.execute('{} tar -xvf {} -C {}'.format(self.target.busybox, database_src, database_dst), as_root=True)
+        self.extract_assets([('mailstore.tar', database_dst)])
         self.target.execute('{0} chown -R {1}:{1} {2}'.format(self.target.busybox, owner, database_dst), as_root=True)
@@ -78,11 +78,9 @@ class GoogleMaps(ApkUiautoWorkload):
     def setup_rerun(self):
         super(GoogleMaps, self).setup_rerun()
         package_data_dir = self.target.path.join(self.target.package_data_directory, self.package)
-        databases_src = self.target.path.join(self.target.working_directory, 'databases.tar')
         databases_dst = self.target.path.join(package_data_dir, 'databases')
-        files_src = self.target.path.join(self.target.working_directory, 'files.tar')
         files_dst = self.target.path.join(package_data_dir, 'files')
         owner = self.target.execute("{} stat -c '%u' {}".format(self.target.busybox, package_data_dir), as_root=True).strip()
-        self.target.execute('{} tar -xvf {} -C {}'.format(self.target.busybox, databases_src, databases_dst), as_root=True)
-        self.target.execute('{} tar -xvf {} -C {}'.format(self.target.busybox, files_src, files_dst), as_root=True)
+        self.extract_assets([('databases.tar', databases_dst),
+                             ('files.tar', files_dst)])
         self.target.execute('{0} chown -R {1}:{1} {2}'.format(self.target.busybox, owner, package_data_dir), as_root=True)
@@ -81,11 +81,13 @@ class IdleWorkload(Workload):
     def teardown(self, context):
         if self.stop_android:
             self.logger.debug('Waiting for Android restart to complete...')
-            # Wait for the boot animation to start and then to finish.
-            while self.target.getprop('init.svc.bootanim') == 'stopped':
-                self.target.sleep(0.2)
-            while self.target.getprop('init.svc.bootanim') == 'running':
-                self.target.sleep(1)
+            # Wait for the boot animation to start and then to finish. This is
+            # polled on the target to avoid a round-trip per check, and so
+            # that the wait ends as soon as the animation does. busybox sleep
+            # is used as toolbox sleep on older releases only takes integers.
+            wait_cmd = 'while [ "$(getprop init.svc.bootanim)" = "{}" ]; do {} sleep 0.2; done'
+            self.target.execute(' && '.join([wait_cmd.format('stopped', self.target.busybox),
+                                             wait_cmd.format('running', self.target.busybox)]))
         if self.screen_off and self.old_screen_state:
             self.target.ensure_screen_is_on()
         elif (self.target.os == 'android'
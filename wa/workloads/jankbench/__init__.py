@@ -216,13 +216,23 @@ class JankbenchRunMonitor(threading.Thread):
 
     def run(self):
         proc = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # Partial lines read from each stream, keyed on file descriptor.
+        pending = {proc.stdout.fileno(): b'', proc.stderr.fileno(): b''}
         while not self.stop_event.is_set():
             if self.run_ended.is_set():
-                self.target.sleep(DELAY)
-            else:
-                ready, _, _ = select.select([proc.stdout, proc.stderr], [], [], 2)
-                if ready:
-                    line = ready[0].readline()
+                self.stop_event.wait(DELAY)
+                continue
+            ready, _, _ = select.select(list(pending), [], [], DELAY)
+            for fd in ready:
+                # Only read what is available so that an incomplete line
+                # cannot block the monitor.
+                data = os.read(fd, 4096)
+                if not data:  # stream closed
+                    del pending[fd]
+                    continue
+                lines = (pending[fd] + data).split(b'\n')
+                pending[fd] = lines.pop()
+                for line in lines:
                     line = line.decode(sys.stdout.encoding, 'replace')
                     if self.regex.search(line):
                         self.run_ended.set()